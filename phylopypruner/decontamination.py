@@ -4,7 +4,6 @@ from __future__ import print_function
 from __future__ import absolute_import
 import sys
 import copy
-import datetime
 from collections import defaultdict
 from functools import partial
 from multiprocessing import Pool
@@ -14,7 +13,6 @@ from .summary import Summary
 from .report import display_otus
 from .prune_paralogs import prune_paralogs
 
-TIMESTAMP = datetime.datetime.now().strftime("%Y-%m-%d")
 SUBCLADE_STATS_FILE = "/subclade_stats.csv"
 
 def _exclude_and_rerun(taxon, summary, pruning_method, min_taxa, outgroup,
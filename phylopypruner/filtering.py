@@ -24,7 +24,7 @@ def _is_short_sequence(sequence, threshold):
     True of False
         True if the sequence length is shorter than the provided threshold.
     """
-    return len(sequence.ungapped()) < threshold
+    return sequence.ungapped_len < threshold
 
 
 def too_few_otus(tree, threshold):
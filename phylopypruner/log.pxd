@@ -0,0 +1,30 @@
+# Augmenting declaration file for log.py. See sequence.pxd for the rationale.
+
+cimport cython
+
+
+@cython.final
+cdef class Log:
+    cdef public object version
+    cdef public object msa
+    cdef public object tree
+    cdef public object msa_file
+    cdef public object tree_file
+    cdef public object outgroup
+    cdef public bint prune_paralogs
+    cdef public object _sequences
+    cdef public object _taxa
+    cdef public object collapsed_nodes
+    cdef public object divergent
+    cdef public object trimmed_seqs
+    cdef public object lbs_removed
+    cdef public object divergent_removed
+    cdef public object ultra_short_branches
+    cdef public object monophylies_masked
+    cdef public object orthologs
+    cdef public object paralogs
+    cdef public object msas_out
+    cdef public object homology_tree
+    cdef public object masked_tree
+    cdef public object masked_tree_str
+    cdef public object settings
@@ -4,13 +4,17 @@ Store information about performed operations.
 
 from __future__ import print_function
 from __future__ import absolute_import
-from datetime import datetime
 import os.path
 from .msa import MultipleSequenceAlignment
+from .settings import Settings
 from . import tree_node
-from . import settings
 
-TIMESTAMP = datetime.now().strftime("%Y-%m-%d")
+try:
+    import numpy as np
+    NUMPY = True
+except ImportError:
+    NUMPY = False
+
 ORTHO_STATS_PATH = "/output_alignment_stats.csv"
 HOMOLOG_STATS_PATH = "/input_alignment_stats.csv"
 ORTHOLOG_STATS_HEADER = "id,otus,sequences,meanSeqLen,shortestSeq,longestSeq,\
@@ -24,279 +28,69 @@ class Log(object):
     """
     A record of a single run.
     """
-    def __init__(self, version, msa=MultipleSequenceAlignment, tree=tree_node.TreeNode(),
-                 settings=settings.Settings()):
-        self._version = version
-        self._msa = msa
-        self._tree = tree
-        self._msa_file = settings.fasta_file
-        self._tree_file = settings.nw_file
-        self._outgroup = settings.outgroup
-        self._prune_paralogs = bool(settings.prune)
-        self._sequences = len(list(self._tree.iter_leaves()))
-        self._taxa = len(set(list(self._tree.iter_otus())))
-        self._collapsed_nodes = 0
-        self._divergent = []
-        self._trimmed_seqs = []
-        self._lbs_removed = []
-        self._divergent_removed = []
-        self._ultra_short_branches = []
-        self._monophylies_masked = []
-        self._orthologs = []
-        self._paralogs = []
-        self._msas_out = []
-        self._homology_tree = None
-        self._masked_tree = None
-        self._masked_tree_str = None
-        self._settings = settings
-
-    @property
-    def version(self):
-        """
-        The version number used for this run.
-        """
-        return self._version
-
-    @version.setter
-    def version(self, value):
-        self._version = value
-
-    @property
-    def msa(self):
-        """
-        The MultipleSequenceAlignment object used for this run.
-        """
-        return self._msa
-
-    @msa.setter
-    def msa(self, value):
-        self._msa = value
-
-    @property
-    def tree(self):
-        """
-        The root of the TreeNode object used for this run.
-        """
-        return self._msa
-
-    @tree.setter
-    def tree(self, value):
-        self._tree = value
-
-    @property
-    def msa_file(self):
-        """
-        The name of the MSA file used in this run.
-        """
-        return self._msa_file
-
-    @msa_file.setter
-    def msa_file(self, value):
-        self._msa_file = value
-
-    @property
-    def tree_file(self):
-        """
-        The name of the Newick file used in this run.
-        """
-        return self._tree_file
-
-    @tree_file.setter
-    def tree_file(self, value):
-        self._tree_file = value
+    __slots__ = ("version", "msa", "tree", "msa_file", "tree_file",
+                 "outgroup", "prune_paralogs", "_sequences", "_taxa",
+                 "collapsed_nodes", "divergent", "trimmed_seqs",
+                 "lbs_removed", "divergent_removed", "ultra_short_branches",
+                 "monophylies_masked", "orthologs", "paralogs", "msas_out",
+                 "homology_tree", "masked_tree", "masked_tree_str",
+                 "settings")
 
-    @property
-    def outgroup(self):
-        """
-        A list of OTUs used as an outgroup in this run.
-        """
-        return self._outgroup
-
-    @outgroup.setter
-    def outgroup(self, value):
-        self._outgroup = value
+    def __init__(self, version, msa=MultipleSequenceAlignment, tree=tree_node.TreeNode(),
+                 settings=Settings()):
+        self.version = version
+        self.msa = msa
+        self.tree = tree
+        self.msa_file = settings.fasta_file
+        self.tree_file = settings.nw_file
+        self.outgroup = settings.outgroup
+        self.prune_paralogs = bool(settings.prune)
+        self._sequences = None
+        self._taxa = None
+        self.collapsed_nodes = 0
+        self.divergent = []
+        self.trimmed_seqs = []
+        self.lbs_removed = []
+        self.divergent_removed = []
+        self.ultra_short_branches = []
+        self.monophylies_masked = []
+        self.orthologs = []
+        self.paralogs = []
+        self.msas_out = []
+        self.homology_tree = None
+        self.masked_tree = None
+        self.masked_tree_str = None
+        self.settings = settings
 
     @property
     def sequences(self):
         """
-        Number of unique sequences used in this run.
+        Number of unique sequences used in this run. The tree is traversed on
+        first access and the counts are cached.
         """
+        if self._sequences is None:
+            self._count_tree()
         return self._sequences
 
-    @sequences.setter
-    def sequences(self, value):
-        self._sequences = value
-
-    @property
-    def trimmed_seqs(self):
-        """
-        A list of sequences that were deleted due to being to short.
-        """
-        return self._trimmed_seqs
-
-    @property
-    def prune_paralogs(self):
-        "True if a prune paralog method was specified for this run."
-        return self._prune_paralogs
-
-    @prune_paralogs.setter
-    def prune_paralogs(self, value):
-        self._prune_paralogs = value
-
-    @property
-    def msas_out(self):
-        """
-        A list of multiple sequence alignments (MSAs) that were added to the
-        output.
-        """
-        return self._msas_out
-
-    @msas_out.setter
-    def msas_out(self, value):
-        self._msas_out = value
-
-    @trimmed_seqs.setter
-    def trimmed_seqs(self, value):
-        self._trimmed_seqs = value
-
-    @property
-    def monophylies_masked(self):
-        """
-        A list of sequences that were removed during monophyletic masking.
-        """
-        return self._monophylies_masked
-
-    @monophylies_masked.setter
-    def monophylies_masked(self, value):
-        self._monophylies_masked = value
-
-    @property
-    def collapsed_nodes(self):
-        """
-        Number of collapsed nodes.
-        """
-        return self._collapsed_nodes
-
-    @collapsed_nodes.setter
-    def collapsed_nodes(self, value):
-        self._collapsed_nodes = value
-
     @property
     def taxa(self):
         """
-        Number of OTUs in the tree.
+        Number of OTUs in the tree. The tree is traversed on first access and
+        the counts are cached.
         """
+        if self._taxa is None:
+            self._count_tree()
         return self._taxa
 
-    @taxa.setter
-    def taxa(self, value):
-        self._taxa = value
-
-    @property
-    def lbs_removed(self):
-        """
-        A list of long branches (LBs) that were removed during the lb-prune
-        stage.
-        """
-        return self._lbs_removed
-
-    @lbs_removed.setter
-    def lbs_removed(self, value):
-        self._lbs_removed = value
-
-    @property
-    def divergent_removed(self):
-        """
-        A list of nodes that were removed due to belonging to an OTU which was
-        flagged as being divergent. Unlike 'divergent', this is a list of nodes
-        that were removed and not OTUs.
-        """
-        return self._divergent_removed
-
-    @divergent_removed.setter
-    def divergent_removed(self, value):
-        self._divergent_removed = value
-
-    @property
-    def ultra_short_branches(self):
-        """
-        A list of branches that were removed due to being below the short
-        sequence threshold.
-        """
-        return self._ultra_short_branches
-
-    @ultra_short_branches.setter
-    def ultra_short_branches(self, value):
-        self._ultra_short_branches = value
-
-    @property
-    def orthologs(self):
-        "A list of TreeNode objects recovered as orthologs."
-        return self._orthologs
-
-    @orthologs.setter
-    def orthologs(self, value):
-        self._orthologs = value
-
-    @property
-    def paralogs(self):
-        "A list of TreeNode objects recovered as paralogs."
-        return self._paralogs
-
-    @paralogs.setter
-    def paralogs(self, value):
-        self._paralogs = value
-
-    @property
-    def homology_tree(self):
-        "The tree as it looked before any operations were performed."
-        return self._homology_tree
-
-    @homology_tree.setter
-    def homology_tree(self, value):
-        self._homology_tree = value
-
-    @property
-    def masked_tree(self):
-        """
-        The tree after monophyletic masking and before the paralogy pruning
-        stage.
-        """
-        return self._masked_tree
-
-    @masked_tree.setter
-    def masked_tree(self, value):
-        self._masked_tree = value
-
-    @property
-    def masked_tree_str(self):
-        """
-        The tree after monophyletic masking and before the paralogy pruning
-        stage as a string.
-        """
-        return self._masked_tree_str
-
-    @masked_tree_str.setter
-    def masked_tree_str(self, value):
-        self._masked_tree_str = value
-
-    @property
-    def settings(self):
-        "The Settings object that stores the settings used in this log."
-        return self._settings
-
-    @settings.setter
-    def settings(self, value):
-        self._settings = value
-
-    @property
-    def divergent(self):
-        "A list of divergent sequences within this log."
-        return self._divergent
-
-    @divergent.setter
-    def divergent(self, value):
-        self._divergent = value
+    def _count_tree(self):
+        "Count the leaves and OTUs within this log's tree in a single pass."
+        otus_in_tree = set()
+        no_of_sequences = 0
+        for leaf in self.tree.iter_leaves():
+            no_of_sequences += 1
+            otus_in_tree.add(leaf.otu())
+        self._sequences = no_of_sequences
+        self._taxa = len(otus_in_tree)
 
     def outgroups_to_str(self):
         """
@@ -306,48 +100,25 @@ class Log(object):
         if self.outgroup:
             if len(self.outgroup) == 1:
                 return "outgroup:\t\t\t\t{}".format(self.outgroup[0])
-            else:
-                outgroups = "outgroups:\t\t\t\t"
-                for index, otu in enumerate(self.outgroup):
-                    if index == len(self.outgroup) - 1:
-                        outgroups += otu
-                    else:
-                        outgroups += "{}, ".format(otu)
-                return outgroups
+            return "outgroups:\t\t\t\t" + ", ".join(self.outgroup)
 
     def paralogs_to_str(self):
         "Returns a string that contains the paralogs found in this run."
-        unique_paralogs = set()
-        seen = set()
         paralog_str = "paralogous OTUs: "
         if self.paralogs:
-            for paralog in self.paralogs:
-                if not paralog.otu() in seen:
-                    unique_paralogs.add(paralog.otu())
-                    seen.add(paralog.otu())
-            for index, paralog in enumerate(unique_paralogs):
-                if index == len(unique_paralogs) - 1:
-                    paralog_str += paralog
-                else:
-                    paralog_str += "{}, ".format(paralog)
-            return paralog_str
-        else:
-            return paralog_str + " none"
+            unique_paralogs = {paralog.otu() for paralog in self.paralogs}
+            return paralog_str + ", ".join(sorted(unique_paralogs))
+        return paralog_str + " none"
 
     def msas_out_to_str(self):
         """
         Returns a string that contains the name of the files that were written
         for this run.
         """
-        msa_out_str = str()
-        for msa_out in self.msas_out:
-            if msa_out is self.msas_out[0]:
-                msa_out_str += "\n"
-            if msa_out is self.msas_out[-1]:
-                msa_out_str += "wrote: {}\n".format(str(msa_out))
-            else:
-                msa_out_str += "wrote: {}".format(str(msa_out))
-        return msa_out_str
+        if not self.msas_out:
+            return ""
+        return "\n" + "\n".join(
+            "wrote: {}".format(msa_out) for msa_out in self.msas_out) + "\n"
 
     def orthologs_to_str(self):
         """
@@ -376,29 +147,33 @@ class Log(object):
         Takes a filename as an input and writes the records in this log to a
         CSV file to the provided path.
         """
-        with open(dir_out + ORTHO_STATS_PATH, "a") as stats_file:
-            for ortholog in self.msas_out:
-                row = "{},{},{},{},{},{},{},{}\n".format(
-                    os.path.basename(str(ortholog)),
-                    len(ortholog),
-                    len(ortholog.otus()),
-                    avg_seq_len(ortholog),
-                    shortest_sequence(ortholog),
-                    longest_sequence(ortholog),
-                    ortholog.missing_data(),
-                    ortholog.alignment_len())
-                stats_file.write(row)
+        ortho_rows = []
+        for ortholog in self.msas_out:
+            avg, shortest, longest, missing, aln_len = _msa_stats(ortholog)
+            ortho_rows.append("{},{},{},{},{},{},{},{}\n".format(
+                os.path.basename(str(ortholog)),
+                len(ortholog),
+                len(ortholog.otus()),
+                avg,
+                shortest,
+                longest,
+                missing,
+                aln_len))
+        if ortho_rows:
+            with open(dir_out + ORTHO_STATS_PATH, "a") as stats_file:
+                stats_file.write("".join(ortho_rows))
 
         with open(dir_out + HOMOLOG_STATS_PATH, "a") as stats_file:
+            avg, shortest, longest, missing, aln_len = _msa_stats(self.msa)
             row = "{},{},{},{},{},{},{},{},{},{},{},{},{}\n".format(
                 os.path.basename(str(self.msa_file)),
                 len(self.msa.otus()),
                 len(self.msa),
-                avg_seq_len(self.msa),
-                shortest_sequence(self.msa),
-                longest_sequence(self.msa),
-                self.msa.missing_data(),
-                self.msa.alignment_len(),
+                avg,
+                shortest,
+                longest,
+                missing,
+                aln_len,
                 len(self.trimmed_seqs),
                 len(self.lbs_removed),
                 len(self.monophylies_masked),
@@ -426,8 +201,9 @@ class Log(object):
         this Log object's list of orthologs. The MSAs are stored in this logs
         list of MSAs called 'msas_out'.
         """
+        single_ortholog = len(self.orthologs) == 1
         for index, ortholog in enumerate(self.orthologs, 1):
-            if len(self.orthologs) == 1:
+            if single_ortholog:
                 msa_out_path, extension = self.msa_out_path(dir_out)
             else:
                 msa_out_path, extension = self.msa_out_path(dir_out, index)
@@ -443,6 +219,38 @@ class Log(object):
         return self.msas_out
 
 
+def _msa_stats(msa):
+    """
+    Takes a MultipleSequenceAlignment object as an input and computes its
+    summary statistics in a single pass over the sequences. Returns a tuple
+    that contains the average, shortest and longest ungapped sequence length,
+    the fraction of missing data and the alignment length. Uses NumPy for the
+    reductions, if it is available.
+    """
+    no_of_sequences = len(msa)
+    if no_of_sequences == 0:
+        return 0, None, None, 0, 0
+    alignment_len = msa.alignment_len()
+
+    if NUMPY:
+        ungapped = np.fromiter(
+            (sequence.ungapped_len for sequence in msa.sequences),
+            np.int64, count=no_of_sequences)
+        ungapped_sum = int(ungapped.sum())
+        shortest = int(ungapped.min())
+        longest = int(ungapped.max())
+    else:
+        ungapped_lens = [sequence.ungapped_len for sequence in msa.sequences]
+        ungapped_sum = sum(ungapped_lens)
+        shortest = min(ungapped_lens)
+        longest = max(ungapped_lens)
+
+    avg = int(ungapped_sum / no_of_sequences)
+    gaps = alignment_len * no_of_sequences - ungapped_sum
+    missing = float(gaps) / (float(alignment_len) * float(no_of_sequences))
+    return avg, shortest, longest, missing, alignment_len
+
+
 def avg_seq_len(msa):
     """
     Takes a MultipleSequenceAlignment object as an input and returns the
@@ -452,7 +260,7 @@ def avg_seq_len(msa):
     sequences = 0
     for sequence in msa.sequences:
         sequences += 1
-        seq_lens += len(sequence.ungapped())
+        seq_lens += sequence.ungapped_len
     if sequences > 0:
         return int(seq_lens / sequences)
     else:
@@ -464,11 +272,8 @@ def shortest_sequence(msa):
     Returns the shortest sequence in the provided MultipleSequenceAlignment
     object.
     """
-    shortest = None
-    for sequence in msa.sequences:
-        if not shortest or shortest > len(sequence.ungapped()):
-            shortest = len(sequence.ungapped())
-    return shortest
+    return min((sequence.ungapped_len for sequence in msa.sequences),
+               default=None)
 
 
 def longest_sequence(msa):
@@ -476,11 +281,8 @@ def longest_sequence(msa):
     Returns the longest sequence in the provided MultipleSequenceAlignment
     object.
     """
-    longest = None
-    for sequence in msa.sequences:
-        if not longest or longest < len(sequence.ungapped()):
-            longest = len(sequence.ungapped())
-    return longest
+    return max((sequence.ungapped_len for sequence in msa.sequences),
+               default=None)
 
 
 def _file_out(path, directory=None, index=""):
@@ -53,7 +53,7 @@ def _sequence_len(msa, description):
     sequence = msa.get_sequence(description)
 
     if sequence:
-        return len(sequence.ungapped())
+        return sequence.ungapped_len
     return 0
 
 
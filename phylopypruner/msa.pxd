@@ -0,0 +1,13 @@
+# Augmenting declaration file for msa.py. See sequence.pxd for the rationale.
+
+cimport cython
+
+
+@cython.final
+@cython.freelist(256)
+cdef class MultipleSequenceAlignment:
+    cdef public str _filename
+    cdef public object _extension
+    cdef public list _sequences
+    cdef public object _by_description
+    cdef public Py_ssize_t _indexed_count
@@ -1,17 +1,21 @@
 "Data type for storing a set of amino acid or nucleotide sequences."
 
 from __future__ import absolute_import
-import re
 from . import report
 from . import sequence
 
 
 class MultipleSequenceAlignment(object):
     "Represents a set of sequences."
+    __slots__ = ("_filename", "_extension", "_sequences", "_by_description",
+                 "_indexed_count")
+
     def __init__(self, filename="", extension=None):
         self._filename = filename
         self._extension = extension
         self._sequences = []
+        self._by_description = None
+        self._indexed_count = 0
 
     def __str__(self):
         return self.filename
@@ -52,6 +56,7 @@ class MultipleSequenceAlignment(object):
     @sequences.setter
     def sequences(self, value):
         self._sequences = value
+        self._by_description = None
 
     def add_sequence(self, seq_record=None, description="", sequence_data=""):
         "Add a sequence object to the sequences list in this alignment object."
@@ -59,17 +64,16 @@ class MultipleSequenceAlignment(object):
             seq_record = sequence.Sequence()
             seq_record.description = description
             seq_record.sequence_data = sequence_data
-            seq_record.otu = re.split(r"\||@", seq_record.description)[0]
-            try:
-                seq_record.identifier = re.split(
-                    r"\||@", seq_record.description)[1]
-            except IndexError:
+            seq_record.otu, seq_record.identifier = \
+                sequence.parse_description(description)
+            if seq_record.identifier is None:
                 report.warning("no description found on split with | or @")
-                seq_record.identifier = None
-        if description:
-            seq_record.otu = re.split(r"\||@", seq_record.description)[0]
-        if sequence_data:
-            seq_record.identifier = re.split(r"\||@", seq_record.description)[1]
+        elif description:
+            # only re-parse the OTU and identifier when the description of an
+            # existing sequence record changes
+            seq_record.description = description
+            seq_record.otu, seq_record.identifier = \
+                sequence.parse_description(description)
 
         self.sequences.append(seq_record)
         return seq_record
@@ -79,10 +83,17 @@ class MultipleSequenceAlignment(object):
         object, if a sequence with that description is found within this
         alignment.
         """
-        for sequence in self.sequences:
-            if description == sequence.description:
-                return sequence
-        return
+        if (self._by_description is None or
+                self._indexed_count != len(self._sequences)):
+            # (re)build the description index; the sequence list may have
+            # been appended to or shrunk since the last lookup
+            index = {}
+            for sequence in self._sequences:
+                if sequence.description not in index:
+                    index[sequence.description] = sequence
+            self._by_description = index
+            self._indexed_count = len(self._sequences)
+        return self._by_description.get(description)
 
     def iter_descriptions(self):
         """Returns an iterator object that includes all sequence descriptions
@@ -114,7 +125,7 @@ class MultipleSequenceAlignment(object):
         gaps = 0
 
         for sequence in self.sequences:
-            gaps += self.alignment_len() - len(sequence.ungapped())
+            gaps += self.alignment_len() - sequence.ungapped_len
 
         return gaps
 
@@ -42,6 +42,17 @@ PURPLE = "\033[35m"
 CYAN = "\033[36m"
 BOLD = "\033[1m"
 UNDERLINE = "\033[4m"
+PALETTE = {"red": RED,
+           "green": GREEN,
+           "yellow": YELLOW,
+           "blue": BLUE,
+           "purple": PURPLE,
+           "cyan": CYAN}
+# message prefixes, built once instead of on every call
+WARNING_PREFIX = YELLOW + "warning: " + NORMAL
+ERROR_PREFIX = RED + "error: " + NORMAL
+TIP_PREFIX = GREEN + "tip: " + NORMAL
+PROGRESS_INDICATOR = GREEN + u">" + NORMAL if COLOR_SUPPORT else u">"
 
 
 def warning(message, display=True):
@@ -61,7 +72,7 @@ def warning(message, display=True):
     warning_message : str
         The formatted string which is also printed to stderr.
     """
-    warning_message = "{}warning: {}{}".format(YELLOW, NORMAL, message)
+    warning_message = WARNING_PREFIX + message
     if display:
         print(warning_message, file=sys.stderr)
     return warning_message
@@ -84,7 +95,7 @@ def error(message, display=True):
     error_message : str
         The formatted string which is also printed to stderr.
     """
-    error_message = "{}error: {}{}".format(RED, NORMAL, message)
+    error_message = ERROR_PREFIX + message
     if display:
         print(error_message, file=sys.stderr)
     return error_message
@@ -107,7 +118,7 @@ def tip(message, display=True):
     warning_message : str
         The formatted string which is also printed to stderr.
     """
-    tip_message = "{}tip: {}{}".format(GREEN, NORMAL, message)
+    tip_message = TIP_PREFIX + message
     if display:
         print(tip_message, file=sys.stderr)
     return tip_message
@@ -158,7 +169,7 @@ def progress_bar(message, replace=True, display=True):
     progress : str
         Your message with the string '->' prepended to it.
     """
-    progress = "{} {}".format(colorize(u">", "green"), message)
+    progress = PROGRESS_INDICATOR + " " + message
     if display and replace:
         sys.stdout.flush()
         print(progress, file=sys.stderr, end="\r")
@@ -241,8 +252,10 @@ def display_otus(otus, display=True):
     formatted_otus : str
       A list of the OTUs as a text string.
     """
-    formatted_otus = ", ".join(
-        [colorize(otu, "red") for otu in otus])
+    if COLOR_SUPPORT:
+        formatted_otus = ", ".join([colorize(otu, "red") for otu in otus])
+    else:
+        formatted_otus = ", ".join(otus)
     formatted_otus = "\n    ".join(wrap(formatted_otus, 150))
     if display:
         print("    " + formatted_otus, file=sys.stderr)
@@ -268,16 +281,9 @@ def colorize(text, color):
     colored_text : str
       The provided text in color, given that colors are supported.
     """
-    palette = {"red": RED,
-               "green": GREEN,
-               "yellow": YELLOW,
-               "blue": BLUE,
-               "purple": PURPLE,
-               "cyan": CYAN}
-    colored_text = "{}{}{}".format(palette[color], text, NORMAL)
-    if COLOR_SUPPORT:
-        return colored_text
-    return text
+    if not COLOR_SUPPORT:
+        return text
+    return PALETTE[color] + text + NORMAL
 
 
 def format_otus(otus):
@@ -0,0 +1,16 @@
+# Augmenting declaration file for sequence.py. When Cython is available, the
+# Sequence class compiles into a cdef class whose fields are C struct slots,
+# which makes attribute access considerably faster. Without Cython, the plain
+# Python module is used as-is.
+
+cimport cython
+
+
+@cython.final
+@cython.freelist(4096)
+cdef class Sequence:
+    cdef public str description
+    cdef public str otu
+    cdef public str identifier
+    cdef public str _sequence_data
+    cdef public object _ungapped_len
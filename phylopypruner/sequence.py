@@ -4,27 +4,49 @@ Amino acid or nucleotide sequence data type.
 
 from __future__ import absolute_import
 import re
+import string
 
-AMINO_ACIDS = "^[ABCDEFGHIKLMNPQRSTUVWYZX*-.]*$"
-NUCLEOTIDES = "^[ATKMBVCNSWDGUYRH-.]*$"
-IUPAC_CODES = (AMINO_ACIDS, NUCLEOTIDES)
+AMINO_ACIDS = frozenset("ABCDEFGHIKLMNPQRSTUVWYZX*-.")
+NUCLEOTIDES = frozenset("ATKMBVCNSWDGUYRH-.")
+IUPAC_CODES = AMINO_ACIDS | NUCLEOTIDES
 # GAP_CHARACTERS = {"-", "?", "x"}
 GAP_CHARACTERS = {"-"}
+NUCLEOTIDE_SET = frozenset("ACGT")
+# splits a FASTA description into an OTU and a unique identifier
+DESC_SPLITTER = re.compile(r"\||@")
+# lowercases a sequence and deletes its gap characters in a single pass
+UNGAP_TABLE = str.maketrans(string.ascii_uppercase, string.ascii_lowercase,
+                            "".join(GAP_CHARACTERS))
+
+
+def parse_description(description):
+    """
+    Takes a FASTA description as an input and returns the OTU and the unique
+    identifier within it as a tuple. The identifier is None if the description
+    does not contain a separator ('|' or '@').
+    """
+    tokens = DESC_SPLITTER.split(description, maxsplit=1)
+    if len(tokens) < 2:
+        return tokens[0], None
+    return tokens[0], tokens[1]
 
 class Sequence(object):
     """
     Represents a biological sequence. If no data type is provided, it will be
     determined based on the file's extension or the sequence content.
     """
+    __slots__ = ("description", "otu", "identifier", "_sequence_data",
+                 "_ungapped_len")
+
     def __init__(self, description="", sequence_data=""):
-        self._description = str(description)
+        self.description = str(description)
         self._sequence_data = str(sequence_data)
-        self._is_alignment = bool(self.is_alignment)
+        self._ungapped_len = None
         if description:
-            self._otu, self._identifier = re.split(r"\||@", description)
+            self.otu, self.identifier = parse_description(description)
         else:
-            self._otu = ""
-            self._identifier = ""
+            self.otu = ""
+            self.identifier = ""
 
     def __str__(self):
         return self.description
@@ -38,15 +60,6 @@ class Sequence(object):
     def __bool__(self):
         return True
 
-    @property
-    def description(self):
-        "A description or name of the sequence."
-        return self._description
-
-    @description.setter
-    def description(self, value):
-        self._description = value
-
     @property
     def sequence_data(self):
         """The raw sequence data."""
@@ -55,28 +68,18 @@ class Sequence(object):
     @sequence_data.setter
     def sequence_data(self, value):
         self._sequence_data = value
+        self._ungapped_len = None
 
     @property
-    def otu(self):
+    def ungapped_len(self):
         """
-        The operational taxonomical unit (OTU) to which this sequence belongs to.
+        The number of positions within this sequence, gap characters excluded.
+        The length is computed once and cached until the sequence data change.
         """
-        return self._otu
-
-    @otu.setter
-    def otu(self, value):
-        self._otu = value
-
-    @property
-    def identifier(self):
-        """
-        A unique identifier for this sequence.
-        """
-        return self._identifier
-
-    @identifier.setter
-    def identifier(self, value):
-        self._identifier = value
+        if self._ungapped_len is None:
+            self._ungapped_len = (len(self._sequence_data) -
+                                  self._sequence_data.count("-"))
+        return self._ungapped_len
 
     @property
     def is_alignment(self):
@@ -86,17 +89,12 @@ class Sequence(object):
         """
         return bool("-" in self.sequence_data)
 
-    @is_alignment.setter
-    def is_alignment(self, value):
-        self._is_alignment = value
-
     def _validate_sequence(self):
         if not self.sequence_data:
             return
-        for letter in self.sequence_data:
-            if letter not in IUPAC_CODES:
-                raise AssertionError('Non-IUPAC codes found in sequence \
-                        {}.'.format(self.description))
+        if set(self.sequence_data.upper()) - IUPAC_CODES:
+            raise AssertionError('Non-IUPAC codes found in sequence \
+                    {}.'.format(self.description))
 
     def count(self, letter):
         """Returns the frequency of the provided letter in this sequence."""
@@ -106,13 +104,13 @@ class Sequence(object):
         """
         Return this sequence's GC content as a floating point number.
         """
-        seq_lower = self.sequence_data.lower()
-        nucleotides = 'acgt'
-        for base in seq_lower:
-            if not base in nucleotides:
-                print('Expected a nucleotide base (a, c, g, t), but found {} \
-                        in sequence {}.'.format(base, self.description))
-        gc_count = seq_lower.count('g') + seq_lower.count('c')
+        if not self.sequence_data:
+            return 0.0
+        seq_upper = self.sequence_data.upper()
+        for base in set(seq_upper) - NUCLEOTIDE_SET:
+            print('Expected a nucleotide base (a, c, g, t), but found {} \
+                    in sequence {}.'.format(base, self.description))
+        gc_count = seq_upper.count('G') + seq_upper.count('C')
         return round(float(gc_count) / len(self.sequence_data), 2)
 
     def ungapped(self):
@@ -121,11 +119,8 @@ class Sequence(object):
         considered include dash ('-'), question mark ('?') and
         uppercase/lowercase X.
         """
-        seq_ungapped = self.sequence_data.lower()
-        for character in GAP_CHARACTERS:
-            seq_ungapped = seq_ungapped.replace(character, "")
-        return seq_ungapped
+        return self.sequence_data.translate(UNGAP_TABLE)
 
     def missing_data(self):
         "Returns the percentage of missing data in this sequence."
-        return float(len(self) - len(self.ungapped())) / float(len(self))
+        return float(len(self) - self.ungapped_len) / float(len(self))
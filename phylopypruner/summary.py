@@ -2,7 +2,6 @@
 
 from __future__ import absolute_import
 import os
-import datetime
 from collections import defaultdict
 from . import fasta
 from . import report
@@ -15,7 +14,6 @@ try:
     MATPLOTLIB = True
 except ImportError:
     MATPLOTLIB = False
-TIMESTAMP = datetime.datetime.now().strftime("%Y-%m-%d")
 SUM_HEADER = "id,alignments,sequences,otus,meanSequences,meanOtus,meanSeqLen,\
 shortestSeq,longestSeq,pctMissingData,catAlignmentLen\n"
 SUM_PATH = "/supermatrix_stats.csv"
@@ -185,7 +183,7 @@ encountered in MSA {}".format(msa.filename))
                     otu = sequence.otu
                     otus_in_alignment.append(otu)
                     if sequence:
-                        occupancy = len(sequence.ungapped()) / float(len(sequence))
+                        occupancy = sequence.ungapped_len / float(len(sequence))
                     else:
                         occupancy = 0
                     gene_occupancies[gene_partition] += occupancy
@@ -381,7 +379,7 @@ encountered in MSA {}".format(msa.filename))
 
             for sequence in msa.sequences:
                 no_of_seqs += 1
-                seq_len = len(sequence.ungapped())
+                seq_len = sequence.ungapped_len
                 seq_lens += seq_len
 
                 if not shortest or shortest > seq_len:
@@ -488,7 +486,7 @@ encountered in MSA {}".format(msa.filename))
 
                 for sequence in msa.sequences:
                     stats["sequences"] += 1
-                    seq_len = len(sequence.ungapped())
+                    seq_len = sequence.ungapped_len
                     stats["seq_lens"] += seq_len
 
                     if stats["shortest"] == 0 or stats["shortest"] > seq_len:
@@ -4,6 +4,7 @@ from __future__ import absolute_import
 import re
 from collections import deque
 from . import report
+from .sequence import DESC_SPLITTER
 
 class TreeNode(object):
     """
@@ -108,7 +109,7 @@ class TreeNode(object):
 
     def otu(self):
         "Returns the OTU to which this node belongs."
-        return re.split(r"\||@", self.name)[0]
+        return DESC_SPLITTER.split(self.name)[0]
 
     def is_root(self):
         "Returns True if this node lacks a parent."
@@ -526,7 +527,7 @@ class TreeNode(object):
     def iter_otus(self):
         "Returns an iterator object that includes all OTUs within this node."
         for name in self.iter_names():
-            otu = re.split(r"\||@", name)[0]
+            otu = DESC_SPLITTER.split(name)[0]
             yield otu
 
     def iter_identifiers(self):
@@ -534,7 +535,7 @@ class TreeNode(object):
         Returns an iterator object that includes all identifiers in this node.
         """
         for name in self.iter_names():
-            identifier = re.split(r"\||@", name)[1]
+            identifier = DESC_SPLITTER.split(name)[1]
             yield identifier
 
     def view(self):
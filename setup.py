@@ -7,6 +7,24 @@ from distutils.util import convert_path
 with open("README.md", "r") as fh:
     LONG_DESCRIPTION = fh.read()
 
+# Cython is optional: when available, the data-holder modules compile into
+# extension modules (the .pxd files turn their classes into cdef classes with
+# C-level attribute access). Without Cython, or if cythonization fails, the
+# pure-Python modules are used instead.
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    EXT_MODULES = []
+else:
+    try:
+        EXT_MODULES = cythonize(
+            ["phylopypruner/sequence.py", "phylopypruner/msa.py",
+             "phylopypruner/log.py"],
+            language_level=3)
+    except Exception:
+        print("warning: could not cythonize, falling back to pure Python")
+        EXT_MODULES = []
+
 with open(convert_path("phylopypruner/VERSION")) as version_file:
     version_no = version_file.read().strip()
 
@@ -19,6 +37,7 @@ setup(
     description="tree-based orthology inference",
     # scripts=['scripts/orthofinder2phylopypruner'],
     packages=find_packages(),
+    ext_modules=EXT_MODULES,
     entry_points={"console_scripts": ["phylopypruner = phylopypruner.__main__:entry"]},
     install_requires=[
         "setuptools>=30.3.0",